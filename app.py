@@ -3,30 +3,78 @@ Main Flask application for Tetris game.
 Handles web routes and API endpoints.
 """
 
-from flask import Flask, render_template, request, jsonify, Response
+from flask import Flask, render_template, request, make_response, Response
 from flask_sqlalchemy import SQLAlchemy
-from datetime import datetime
-from typing import Dict, Any, List, Optional, Tuple
+from pydantic import BaseModel, Field, StringConstraints, ValidationError
+from sqlalchemy import event
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Engine, make_url
+from typing import Annotated, Callable, Dict, Any, List, Optional, Tuple, Union
+from werkzeug.http import generate_etag
+import orjson
 import os
+import sqlite3
+import threading
+import time
+
+
+def build_engine_options(database_uri: str) -> Dict[str, Any]:
+    """
+    Build SQLAlchemy engine options suited to the given database URI.
+    
+    Args:
+        database_uri: SQLAlchemy database URL the engine will connect to
+        
+    Returns:
+        Engine options; pool sizing is only set for file-backed databases, since
+        in-memory SQLite runs on a StaticPool that rejects those arguments
+    """
+    options: Dict[str, Any] = {
+        'pool_pre_ping': True,
+        'pool_recycle': 1800,
+        'connect_args': {'check_same_thread': False, 'timeout': 5}
+    }
+    if make_url(database_uri).database not in (None, '', ':memory:'):
+        options.update(pool_size=10, max_overflow=20, pool_timeout=30)
+    return options
+
 
 app = Flask(__name__)
 
 # Database configuration
 basedir = os.path.abspath(os.path.dirname(__file__))
-app.config['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{os.path.join(basedir, "tetris.db")}'
+app.config['SQLALCHEMY_DATABASE_URI'] = os.environ.get(
+    'DATABASE_URL', f'sqlite:///{os.path.join(basedir, "tetris.db")}'
+)
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+app.config['SQLALCHEMY_ENGINE_OPTIONS'] = build_engine_options(app.config['SQLALCHEMY_DATABASE_URI'])
 app.config['SECRET_KEY'] = 'your-secret-key-here'
 
 db = SQLAlchemy(app)
 
 
+@event.listens_for(Engine, 'connect')
+def set_sqlite_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+    """Tune every new SQLite connection for concurrent reads and cheaper commits."""
+    if not isinstance(dbapi_connection, sqlite3.Connection):
+        return
+    cursor = dbapi_connection.cursor()
+    cursor.execute('PRAGMA journal_mode=WAL')
+    cursor.execute('PRAGMA synchronous=NORMAL')
+    cursor.execute('PRAGMA busy_timeout=5000')
+    cursor.execute('PRAGMA cache_size=-20000')
+    cursor.execute('PRAGMA temp_store=MEMORY')
+    cursor.execute('PRAGMA foreign_keys=ON')
+    cursor.close()
+
+
 # Database models (moved here to fix import issues)
 class Player(db.Model):
     """Player model for storing user information."""
     
     id = db.Column(db.Integer, primary_key=True)
     username = db.Column(db.String(50), unique=True, nullable=False)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, server_default=db.func.current_timestamp())
     scores = db.relationship('Score', backref='player', lazy=True)
     
     def __repr__(self) -> str:
@@ -41,7 +89,11 @@ class Score(db.Model):
     score = db.Column(db.Integer, nullable=False)
     lines_cleared = db.Column(db.Integer, default=0)
     level = db.Column(db.Integer, default=1)
-    timestamp = db.Column(db.DateTime, default=datetime.utcnow)
+    timestamp = db.Column(db.DateTime, server_default=db.func.current_timestamp())
+    
+    __table_args__ = (
+        db.Index('ix_score_desc_player', score.desc(), player_id),
+    )
     
     def __repr__(self) -> str:
         return f'<Score {self.score} by Player {self.player_id}>'
@@ -58,6 +110,133 @@ class Score(db.Model):
         }
 
 
+def json_response(data: Any, status: int = 200) -> Tuple[Response, int]:
+    """
+    Serialize data to a JSON response with orjson.
+    
+    Args:
+        data: JSON-compatible data; datetimes are encoded as ISO 8601 strings
+        status: HTTP status code
+        
+    Returns:
+        Tuple of the JSON response and its status code
+    """
+    return Response(orjson.dumps(data), mimetype='application/json'), status
+
+
+LEADERBOARD_MAX_AGE = 30  # seconds clients may reuse a leaderboard response
+
+
+def make_cacheable(response: Response, etag: str, max_age: int = LEADERBOARD_MAX_AGE) -> Response:
+    """
+    Mark a response as publicly cacheable and answer conditional requests.
+    
+    Args:
+        response: Response to tag with an ETag and Cache-Control header
+        etag: Precomputed ETag of the response body
+        max_age: Number of seconds the response may be cached
+        
+    Returns:
+        The same response, turned into a 304 if the client's ETag matches
+    """
+    response.cache_control.public = True
+    response.cache_control.max_age = max_age
+    response.set_etag(etag)
+    return response.make_conditional(request)
+
+
+# Process-local cache of rendered leaderboards, keyed by view name. Saving a score
+# clears it in this process; other worker processes pick the change up once their
+# entries expire after LEADERBOARD_MAX_AGE, the same staleness clients already accept.
+leaderboard_cache: Dict[str, Any] = {'version': 0, 'entries': {}}
+leaderboard_cache_lock = threading.Lock()
+
+
+def get_cached_leaderboard(key: str, build: Callable[[], Union[str, bytes]]) -> Tuple[Union[str, bytes], str]:
+    """
+    Return a cached leaderboard rendering, building and storing it on a miss.
+    
+    Args:
+        key: Name of the cached rendering
+        build: Callable producing the rendering from the database
+        
+    Returns:
+        Tuple of the cached or freshly built rendering and its ETag
+    """
+    with leaderboard_cache_lock:
+        version: int = leaderboard_cache['version']
+        entry: Optional[Tuple[float, Union[str, bytes], str]] = leaderboard_cache['entries'].get(key)
+    
+    if entry is not None and entry[0] > time.monotonic():
+        return entry[1], entry[2]
+    
+    payload = build()
+    # Hash once per build so cache hits can reuse the ETag
+    etag = generate_etag(payload.encode() if isinstance(payload, str) else payload)
+    with leaderboard_cache_lock:
+        # Skip the store if a score was saved while this rendering was being built
+        if leaderboard_cache['version'] == version:
+            leaderboard_cache['entries'][key] = (time.monotonic() + LEADERBOARD_MAX_AGE, payload, etag)
+    return payload, etag
+
+
+def invalidate_leaderboard_cache() -> None:
+    """Drop all cached leaderboard renderings after the scores have changed."""
+    with leaderboard_cache_lock:
+        leaderboard_cache['version'] += 1
+        leaderboard_cache['entries'].clear()
+
+
+def query_top_scores() -> List[Any]:
+    """
+    Load the top 10 scores with their player names as plain row mappings.
+    
+    Returns:
+        Read-only mappings with id, username, score, lines_cleared, level and timestamp
+    """
+    stmt = (
+        db.select(Score.id, Player.username, Score.score, Score.lines_cleared, Score.level, Score.timestamp)
+        .join(Player)
+        .order_by(Score.score.desc())
+        .limit(10)
+    )
+    return db.session.execute(stmt).mappings().all()
+
+
+class ScoreSubmission(BaseModel):
+    """Validated body of a score submission."""
+    
+    username: Annotated[str, StringConstraints(strip_whitespace=True, min_length=1, max_length=50)]
+    score: Annotated[int, Field(strict=True, ge=0)]
+    lines: Annotated[int, Field(strict=True, ge=0)] = 0
+    level: Annotated[int, Field(strict=True, ge=1)] = 1
+
+
+# Error message reported for the first invalid field of a score submission
+SCORE_FIELD_ERRORS: Dict[str, str] = {
+    'username': 'Invalid username',
+    'score': 'Invalid score',
+    'lines': 'Invalid lines count',
+    'level': 'Invalid level'
+}
+
+
+def score_validation_message(error: ValidationError) -> str:
+    """
+    Describe why a score submission was rejected.
+    
+    Args:
+        error: Validation error raised for the submission
+        
+    Returns:
+        Message for the first failing field, or a missing-data message
+    """
+    errors = error.errors()
+    if any(err['type'] in ('missing', 'model_type') for err in errors):
+        return 'Missing required data'
+    return SCORE_FIELD_ERRORS.get(str(errors[0]['loc'][0]), 'Invalid score data')
+
+
 @app.route('/')
 def index() -> str:
     """Render the main game page."""
@@ -65,10 +244,13 @@ def index() -> str:
 
 
 @app.route('/leaderboard')
-def leaderboard() -> str:
+def leaderboard() -> Response:
     """Display the top 10 scores."""
-    top_scores: List[Score] = Score.query.order_by(Score.score.desc()).limit(10).all()
-    return render_template('leaderboard.html', scores=top_scores)
+    html, etag = get_cached_leaderboard(
+        'leaderboard',
+        lambda: render_template('leaderboard.html', scores=query_top_scores())
+    )
+    return make_cacheable(make_response(html), etag)
 
 
 @app.route('/api/score', methods=['POST'])
@@ -80,51 +262,39 @@ def save_score() -> Tuple[Response, int]:
         JSON response with success status and message
     """
     try:
-        data: Optional[Dict[str, Any]] = request.json
-        
-        if not data or 'username' not in data or 'score' not in data:
-            return jsonify({'success': False, 'message': 'Missing required data'}), 400
-        
-        username: str = data['username']
-        score: int = data['score']
-        lines: int = data.get('lines', 0)
-        level: int = data.get('level', 1)
-        
-        # Validate input data
-        if not isinstance(username, str) or not username.strip():
-            return jsonify({'success': False, 'message': 'Invalid username'}), 400
+        try:
+            submission = ScoreSubmission.model_validate(request.json)
+        except ValidationError as e:
+            return json_response({'success': False, 'message': score_validation_message(e)}, 400)
         
-        if not isinstance(score, int) or score < 0:
-            return jsonify({'success': False, 'message': 'Invalid score'}), 400
+        username: str = submission.username
         
-        if not isinstance(lines, int) or lines < 0:
-            return jsonify({'success': False, 'message': 'Invalid lines count'}), 400
-        
-        if not isinstance(level, int) or level < 1:
-            return jsonify({'success': False, 'message': 'Invalid level'}), 400
-        
-        # Get or create player
-        player: Optional[Player] = Player.query.filter_by(username=username.strip()).first()
-        if not player:
-            player = Player(username=username.strip())
-            db.session.add(player)
-            db.session.commit()
+        # Get or create player in a single statement (no-op if the username exists)
+        db.session.execute(
+            sqlite_insert(Player)
+            .values(username=username)
+            .on_conflict_do_nothing(index_elements=['username'])
+        )
+        player_id: int = db.session.execute(
+            db.select(Player.id).where(Player.username == username)
+        ).scalar_one()
         
         # Save score
         new_score = Score(
-            player_id=player.id,
-            score=score,
-            lines_cleared=lines,
-            level=level
+            player_id=player_id,
+            score=submission.score,
+            lines_cleared=submission.lines,
+            level=submission.level
         )
         db.session.add(new_score)
         db.session.commit()
+        invalidate_leaderboard_cache()
         
-        return jsonify({'success': True, 'message': 'Score saved successfully'}), 200
+        return json_response({'success': True, 'message': 'Score saved successfully'}, 200)
     
     except Exception as e:
         db.session.rollback()
-        return jsonify({'success': False, 'message': str(e)}), 500
+        return json_response({'success': False, 'message': str(e)}, 500)
 
 
 @app.route('/api/top-scores')
@@ -136,13 +306,16 @@ def get_top_scores() -> Tuple[Response, int]:
         JSON array of top scores with player information
     """
     try:
-        top_scores: List[Score] = Score.query.order_by(Score.score.desc()).limit(10).all()
-        scores_data: List[Dict[str, Any]] = [score.to_dict() for score in top_scores]
+        payload, etag = get_cached_leaderboard(
+            'top_scores',
+            lambda: orjson.dumps([dict(row) for row in query_top_scores()])
+        )
         
-        return jsonify(scores_data), 200
+        response = make_cacheable(Response(payload, mimetype='application/json'), etag)
+        return response, response.status_code
     
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return json_response({'error': str(e)}, 500)
 
 
 @app.route('/api/player/<string:username>/stats')
@@ -157,16 +330,24 @@ def get_player_stats(username: str) -> Tuple[Response, int]:
         JSON object with player statistics
     """
     try:
-        player: Optional[Player] = Player.query.filter_by(username=username).first()
+        player_id: Optional[int] = db.session.execute(
+            db.select(Player.id).where(Player.username == username)
+        ).scalar()
         
-        if not player:
-            return jsonify({'error': 'Player not found'}), 404
+        if player_id is None:
+            return json_response({'error': 'Player not found'}, 404)
         
-        scores: List[Score] = Score.query.filter_by(player_id=player.id).all()
+        games_played, best_score, total_lines, max_level, total_score = db.session.query(
+            db.func.count(Score.id),
+            db.func.max(Score.score),
+            db.func.sum(Score.lines_cleared),
+            db.func.max(Score.level),
+            db.func.sum(Score.score)
+        ).filter(Score.player_id == player_id).one()
         
-        if not scores:
+        if not games_played:
             stats = {
-                'username': player.username,
+                'username': username,
                 'games_played': 0,
                 'best_score': 0,
                 'total_lines': 0,
@@ -175,18 +356,18 @@ def get_player_stats(username: str) -> Tuple[Response, int]:
             }
         else:
             stats = {
-                'username': player.username,
-                'games_played': len(scores),
-                'best_score': max(score.score for score in scores),
-                'total_lines': sum(score.lines_cleared for score in scores),
-                'max_level': max(score.level for score in scores),
-                'average_score': sum(score.score for score in scores) // len(scores)
+                'username': username,
+                'games_played': games_played,
+                'best_score': best_score,
+                'total_lines': total_lines,
+                'max_level': max_level,
+                'average_score': total_score // games_played
             }
         
-        return jsonify(stats), 200
+        return json_response(stats, 200)
     
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return json_response({'error': str(e)}, 500)
 
 
 @app.errorhandler(404)
@@ -216,6 +397,7 @@ def create_app() -> Flask:
 
 
 if __name__ == '__main__':
+    # Development server only; production is served by gunicorn (see gunicorn.conf.py)
     with app.app_context():
         db.create_all()
-    app.run(debug=True, host='0.0.0.0', port=5000)
\ No newline at end of file
+    app.run(debug=os.environ.get('FLASK_ENV') != 'production', host='0.0.0.0', port=5000)
\ No newline at end of file
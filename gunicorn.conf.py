@@ -0,0 +1,16 @@
+"""
+Gunicorn configuration for serving the Tetris game in production.
+Run with: gunicorn -c gunicorn.conf.py app:app
+"""
+
+import os
+
+bind = os.environ.get('GUNICORN_BIND', '0.0.0.0:5000')
+
+# Threaded workers suit this I/O-bound app: SQLite commits release the GIL
+worker_class = 'gthread'
+workers = int(os.environ.get('GUNICORN_WORKERS', 2))
+threads = int(os.environ.get('GUNICORN_THREADS', 8))
+
+preload_app = True
+timeout = 30
@@ -3,9 +3,9 @@ Database models for storing game data.
 Uses SQLAlchemy ORM for database operations.
 """
 
-from datetime import datetime
 from typing import Dict, Any, List, Optional
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
 # This would typically be imported from app.py, but we'll define it here for clarity
 # In practice, you'd import: from app import db
@@ -19,7 +19,7 @@ class Player(db.Model):
     
     id = db.Column(db.Integer, primary_key=True)
     username = db.Column(db.String(50), unique=True, nullable=False, index=True)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    created_at = db.Column(db.DateTime, server_default=db.func.current_timestamp(), nullable=False)
     scores = db.relationship('Score', backref='player', lazy=True, cascade='all, delete-orphan')
     
     def __init__(self, username: str) -> None:
@@ -30,7 +30,6 @@ class Player(db.Model):
             username: Unique username for the player
         """
         self.username = username
-        self.created_at = datetime.utcnow()
     
     def __repr__(self) -> str:
         return f'<Player {self.username}>'
@@ -85,18 +84,21 @@ class Player(db.Model):
         """
         Get an existing player or create a new one.
         
+        Uses an ``INSERT ... ON CONFLICT DO NOTHING`` upsert and does not
+        commit; the caller is responsible for committing the transaction.
+        
         Args:
             username: Player's username
             
         Returns:
             Player instance (existing or newly created)
         """
-        player = cls.query.filter_by(username=username).first()
-        if not player:
-            player = cls(username=username)
-            db.session.add(player)
-            db.session.commit()
-        return player
+        db.session.execute(
+            sqlite_insert(cls)
+            .values(username=username)
+            .on_conflict_do_nothing(index_elements=['username'])
+        )
+        return cls.query.filter_by(username=username).one()
 
 
 class Score(db.Model):
@@ -106,10 +108,15 @@ class Score(db.Model):
     
     id = db.Column(db.Integer, primary_key=True)
     player_id = db.Column(db.Integer, db.ForeignKey('player.id'), nullable=False, index=True)
-    score = db.Column(db.Integer, nullable=False, index=True)
+    score = db.Column(db.Integer, nullable=False)
     lines_cleared = db.Column(db.Integer, default=0, nullable=False)
     level = db.Column(db.Integer, default=1, nullable=False)
-    timestamp = db.Column(db.DateTime, default=datetime.utcnow, nullable=False, index=True)
+    timestamp = db.Column(db.DateTime, server_default=db.func.current_timestamp(), nullable=False)
+    
+    __table_args__ = (
+        db.Index('ix_score_desc_player', score.desc(), player_id),
+        db.Index('ix_score_timestamp_desc', timestamp.desc(), id.desc()),
+    )
     
     def __init__(self, player_id: int, score: int, lines_cleared: int = 0, level: int = 1) -> None:
         """
@@ -125,7 +132,6 @@ class Score(db.Model):
         self.score = score
         self.lines_cleared = lines_cleared
         self.level = level
-        self.timestamp = datetime.utcnow()
     
     def __repr__(self) -> str:
         return f'<Score {self.score} by Player {self.player_id}>'
@@ -158,7 +164,7 @@ class Score(db.Model):
         Returns:
             List of Score objects ordered by score descending
         """
-        return cls.query.order_by(cls.score.desc()).limit(limit).all()
+        return cls.query.options(db.joinedload(cls.player)).order_by(cls.score.desc()).limit(limit).all()
     
     @classmethod
     def get_recent_scores(cls, limit: int = 10) -> List['Score']:
@@ -171,7 +177,7 @@ class Score(db.Model):
         Returns:
             List of Score objects ordered by timestamp descending
         """
-        return cls.query.order_by(cls.timestamp.desc()).limit(limit).all()
+        return cls.query.options(db.joinedload(cls.player)).order_by(cls.timestamp.desc(), cls.id.desc()).limit(limit).all()
     
     @classmethod
     def get_player_scores(cls, player_id: int) -> List['Score']:
@@ -194,7 +200,13 @@ class Score(db.Model):
         Returns:
             Dictionary with various game statistics
         """
-        total_games = cls.query.count()
+        total_games, highest_score, total_score, total_lines, highest_level = db.session.query(
+            db.func.count(cls.id),
+            db.func.max(cls.score),
+            db.func.sum(cls.score),
+            db.func.sum(cls.lines_cleared),
+            db.func.max(cls.level)
+        ).one()
         if total_games == 0:
             return {
                 'total_games': 0,
@@ -204,13 +216,12 @@ class Score(db.Model):
                 'highest_level': 1
             }
         
-        scores = cls.query.all()
         return {
             'total_games': total_games,
-            'highest_score': max(score.score for score in scores),
-            'average_score': sum(score.score for score in scores) / total_games,
-            'total_lines_cleared': sum(score.lines_cleared for score in scores),
-            'highest_level': max(score.level for score in scores)
+            'highest_score': highest_score,
+            'average_score': total_score / total_games,
+            'total_lines_cleared': total_lines,
+            'highest_level': highest_level
         }
 
 
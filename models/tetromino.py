@@ -1,10 +1,11 @@
 """
-Tetromino classes for Tetris game pieces.
-Implements all seven standard Tetris pieces using OOP.
+Tetromino pieces for the Tetris game.
+Implements all seven standard Tetris pieces from precomputed shape tables.
 """
 
+from collections import deque
 from enum import Enum
-from typing import List, Tuple, Type, Union
+from typing import Deque, Dict, List, NamedTuple, Sequence, Tuple, Union
 import random
 
 
@@ -19,31 +20,174 @@ class TetrominoType(Enum):
     L = 'L'
 
 
+# A shape is stored as one bitmask per row: bit n is set when column n is filled
+ShapeRows = Tuple[int, ...]
+
+# (dx, dy) offsets of a shape's filled cells relative to the piece position
+BlockOffsets = Tuple[Tuple[int, int], ...]
+
+
+def _pack_rows(matrix: List[List[int]]) -> ShapeRows:
+    """
+    Pack a shape matrix into per-row bitmasks.
+    
+    Args:
+        matrix: 2D list representing the piece shape (1 for filled, 0 for empty)
+    
+    Returns:
+        Tuple with one bitmask per matrix row
+    """
+    return tuple(
+        sum(1 << col for col, cell in enumerate(row) if cell)
+        for row in matrix
+    )
+
+
+def _build_rotations(matrix: List[List[int]]) -> Tuple[ShapeRows, ...]:
+    """
+    Precompute the four clockwise rotation states of a shape.
+    
+    Args:
+        matrix: Shape matrix in its spawn orientation
+    
+    Returns:
+        Packed rows for rotations 0-3, indexed by the piece's rotation value
+    """
+    rotations: List[ShapeRows] = []
+    for _ in range(4):
+        rotations.append(_pack_rows(matrix))
+        # Rotate clockwise: transpose then reverse each row
+        matrix = [list(row) for row in zip(*matrix[::-1])]
+    return tuple(rotations)
+
+
+def _block_offsets(rows: ShapeRows) -> BlockOffsets:
+    """
+    List the filled cells of a packed shape.
+    
+    Args:
+        rows: Packed shape rows
+    
+    Returns:
+        (dx, dy) offsets of the filled cells in row-major order
+    """
+    offsets: List[Tuple[int, int]] = []
+    for row_idx, mask in enumerate(rows):
+        # Visit set bits lowest first, i.e. columns left to right
+        while mask:
+            bit = mask & -mask
+            offsets.append((bit.bit_length() - 1, row_idx))
+            mask ^= bit
+    return tuple(offsets)
+
+
+class PieceData(NamedTuple):
+    """Precomputed, immutable description of one piece type."""
+    
+    color: str
+    color_int: int
+    color_rgb: Tuple[int, int, int]
+    shapes: Tuple[ShapeRows, ...]
+    offsets: Tuple[BlockOffsets, ...]
+    dims: Tuple[Tuple[int, int], ...]
+
+
+def _build_piece_data(matrix: List[List[int]], color: str) -> PieceData:
+    """
+    Precompute the lookup tables for a piece type.
+    
+    Args:
+        matrix: Shape matrix in its spawn orientation
+        color: Hex color string for the piece
+    
+    Returns:
+        PieceData with per-rotation shapes, block offsets and bounding boxes
+    """
+    shapes = _build_rotations(matrix)
+    color_int = int(color[1:], 16)
+    return PieceData(
+        color=color,
+        color_int=color_int,
+        color_rgb=((color_int >> 16) & 0xFF, (color_int >> 8) & 0xFF, color_int & 0xFF),
+        shapes=shapes,
+        offsets=tuple(_block_offsets(rows) for rows in shapes),
+        # Shapes are square, so the bounding box is as wide as it is tall
+        dims=tuple((len(rows), len(rows)) for rows in shapes)
+    )
+
+
+# Lookup tables for every piece type
+PIECE_DATA: Dict[TetrominoType, PieceData] = {
+    TetrominoType.I: _build_piece_data([
+        [0, 0, 0, 0],
+        [1, 1, 1, 1],
+        [0, 0, 0, 0],
+        [0, 0, 0, 0]
+    ], '#00F0F0'),  # Cyan
+    # All four rotations of the square are identical, so rotating it changes nothing visible
+    TetrominoType.O: _build_piece_data([
+        [1, 1],
+        [1, 1]
+    ], '#F0F000'),  # Yellow
+    TetrominoType.T: _build_piece_data([
+        [0, 1, 0],
+        [1, 1, 1],
+        [0, 0, 0]
+    ], '#A000F0'),  # Purple
+    TetrominoType.S: _build_piece_data([
+        [0, 1, 1],
+        [1, 1, 0],
+        [0, 0, 0]
+    ], '#00F000'),  # Green
+    TetrominoType.Z: _build_piece_data([
+        [1, 1, 0],
+        [0, 1, 1],
+        [0, 0, 0]
+    ], '#F00000'),  # Red
+    TetrominoType.J: _build_piece_data([
+        [1, 0, 0],
+        [1, 1, 1],
+        [0, 0, 0]
+    ], '#0000F0'),  # Blue
+    TetrominoType.L: _build_piece_data([
+        [0, 0, 1],
+        [1, 1, 1],
+        [0, 0, 0]
+    ], '#F0A000'),  # Orange
+}
+
+
 class Tetromino:
-    """Base class for all Tetris pieces."""
+    """A Tetris piece of any type, driven by the PIECE_DATA tables."""
+    
+    __slots__ = ('kind', 'x', 'y', 'rotation', 'shape', 'color', 'color_rgb', '_data')
     
-    def __init__(self, x: int = 0, y: int = 0) -> None:
+    def __init__(self, kind: TetrominoType, x: int = 0, y: int = 0) -> None:
         """
         Initialize a tetromino piece.
         
         Args:
+            kind: Type of the piece
             x: Initial x position
             y: Initial y position
         """
+        self._data: PieceData = PIECE_DATA[kind]
+        self.kind: TetrominoType = kind
         self.x: int = x
         self.y: int = y
         self.rotation: int = 0
-        self.shape: List[List[int]] = self.get_shape()
-        self.color: str = self.get_color()
+        self.shape: ShapeRows = self._data.shapes[0]
+        self.color: str = self._data.color
+        self.color_rgb: Tuple[int, int, int] = self._data.color_rgb
     
-    def get_shape(self) -> List[List[int]]:
+    def get_shape(self) -> ShapeRows:
         """
-        Get the shape matrix for the piece.
+        Get the shape of the piece in its current rotation.
         
         Returns:
-            2D list representing the piece shape (1 for filled, 0 for empty)
+            Tuple with one bitmask per row (bit n set for a filled cell in column n)
         """
-        raise NotImplementedError("Subclasses must implement get_shape method")
+        return self.shape
     
     def get_color(self) -> str:
         """
@@ -52,7 +196,25 @@ class Tetromino:
         Returns:
             Hex color string for the piece
         """
-        raise NotImplementedError("Subclasses must implement get_color method")
+        return self.color
+    
+    def get_color_rgb(self) -> Tuple[int, int, int]:
+        """
+        Get the color of the piece as RGB components.
+        
+        Returns:
+            (red, green, blue) tuple with components from 0 to 255
+        """
+        return self.color_rgb
+    
+    def get_color_int(self) -> int:
+        """
+        Get the color of the piece packed into a single integer.
+        
+        Returns:
+            0xRRGGBB value of the piece color
+        """
+        return self._data.color_int
     
     def rotate(self, clockwise: bool = True) -> None:
         """
@@ -61,14 +223,8 @@ class Tetromino:
         Args:
             clockwise: Direction of rotation (True for clockwise, False for counter-clockwise)
         """
-        if clockwise:
-            # Rotate clockwise: transpose then reverse each row
-            self.shape = [list(row) for row in zip(*self.shape[::-1])]
-        else:
-            # Rotate counter-clockwise: reverse each row then transpose
-            self.shape = [list(row) for row in zip(*self.shape)][::-1]
-        
-        self.rotation = (self.rotation + (1 if clockwise else -1)) % 4
+        self.rotation = (self.rotation + (1 if clockwise else -1)) & 3
+        self.shape = self._data.shapes[self.rotation]
     
     def get_blocks(self) -> List[Tuple[int, int]]:
         """
@@ -77,12 +233,50 @@ class Tetromino:
         Returns:
             List of (x, y) tuples for each filled block in the piece
         """
-        blocks: List[Tuple[int, int]] = []
-        for row_idx, row in enumerate(self.shape):
-            for col_idx, cell in enumerate(row):
-                if cell:
-                    blocks.append((self.x + col_idx, self.y + row_idx))
-        return blocks
+        ox, oy = self.x, self.y
+        return [(ox + dx, oy + dy) for dx, dy in self._data.offsets[self.rotation]]
+    
+    def rows(self) -> ShapeRows:
+        """
+        Get the piece's rows as bitmasks for bitboard collision tests.
+        
+        Returns:
+            Tuple with one bitmask per row (bit n set for a filled cell in column n)
+        """
+        return self.shape
+    
+    def collides(self, board_rows: Sequence[int], board_width: int = 10) -> bool:
+        """
+        Test the piece against a board stored as one bitmask per row.
+        
+        Rows above the top of the board are open, matching how pieces spawn.
+        
+        Args:
+            board_rows: Occupancy bitmask for each board row (bit n set when column n is filled)
+            board_width: Number of columns on the board
+        
+        Returns:
+            True if any block overlaps a filled cell or lies outside the walls or floor
+        """
+        full_row = (1 << board_width) - 1
+        height = len(board_rows)
+        
+        for row_idx, mask in enumerate(self.shape):
+            if not mask:
+                continue
+            
+            y = self.y + row_idx
+            if self.x < 0:
+                # Blocks shifted past the left wall would be dropped by the shift
+                if mask & ((1 << -self.x) - 1):
+                    return True
+                bits = mask >> -self.x
+            else:
+                bits = mask << self.x
+            
+            if bits & ~full_row or y >= height or (y >= 0 and board_rows[y] & bits):
+                return True
+        return False
     
     def get_width(self) -> int:
         """
@@ -91,7 +285,7 @@ class Tetromino:
         Returns:
             Width in blocks
         """
-        return len(self.shape[0]) if self.shape else 0
+        return self._data.dims[self.rotation][0]
     
     def get_height(self) -> int:
         """
@@ -100,139 +294,46 @@ class Tetromino:
         Returns:
             Height in blocks
         """
-        return len(self.shape)
+        return self._data.dims[self.rotation][1]
     
     def copy(self) -> 'Tetromino':
         """
-        Create a deep copy of the piece.
+        Create a copy of the piece.
+        
+        Shapes are immutable and shared, so the copy skips __init__ and
+        only assigns the slots.
         
         Returns:
             New Tetromino instance with the same properties
         """
-        new_piece = self.__class__(self.x, self.y)
-        new_piece.rotation = self.rotation
-        new_piece.shape = [row[:] for row in self.shape]  # Deep copy of shape
+        new_piece = object.__new__(self.__class__)
+        new_piece._data, new_piece.kind = self._data, self.kind
+        new_piece.x, new_piece.y = self.x, self.y
+        new_piece.rotation, new_piece.shape = self.rotation, self.shape
+        new_piece.color, new_piece.color_rgb = self.color, self.color_rgb
         return new_piece
     
     def __repr__(self) -> str:
-        return f'<{self.__class__.__name__} at ({self.x}, {self.y}) rotation={self.rotation}>'
+        return f'<{self.__class__.__name__} {self.kind.value} at ({self.x}, {self.y}) rotation={self.rotation}>'
 
 
-class I_Piece(Tetromino):
-    """I-shaped tetromino (straight piece)."""
-    
-    def get_shape(self) -> List[List[int]]:
-        return [
-            [0, 0, 0, 0],
-            [1, 1, 1, 1],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0]
-        ]
-    
-    def get_color(self) -> str:
-        return '#00F0F0'  # Cyan
+# All piece types, in TetrominoType order
+PIECE_TYPES: Tuple[TetrominoType, ...] = tuple(TetrominoType)
 
+# Piece types keyed by their one-letter value ('I', 'O', ...)
+_TYPE_BY_NAME: Dict[str, TetrominoType] = {piece_type.value: piece_type for piece_type in PIECE_TYPES}
 
-class O_Piece(Tetromino):
-    """O-shaped tetromino (square piece)."""
-    
-    def get_shape(self) -> List[List[int]]:
-        return [
-            [1, 1],
-            [1, 1]
-        ]
-    
-    def get_color(self) -> str:
-        return '#F0F000'  # Yellow
-    
-    def rotate(self, clockwise: bool = True) -> None:
-        """O piece doesn't rotate - override to prevent rotation."""
-        pass
-
-
-class T_Piece(Tetromino):
-    """T-shaped tetromino."""
-    
-    def get_shape(self) -> List[List[int]]:
-        return [
-            [0, 1, 0],
-            [1, 1, 1],
-            [0, 0, 0]
-        ]
-    
-    def get_color(self) -> str:
-        return '#A000F0'  # Purple
-
-
-class S_Piece(Tetromino):
-    """S-shaped tetromino."""
-    
-    def get_shape(self) -> List[List[int]]:
-        return [
-            [0, 1, 1],
-            [1, 1, 0],
-            [0, 0, 0]
-        ]
-    
-    def get_color(self) -> str:
-        return '#00F000'  # Green
-
-
-class Z_Piece(Tetromino):
-    """Z-shaped tetromino."""
-    
-    def get_shape(self) -> List[List[int]]:
-        return [
-            [1, 1, 0],
-            [0, 1, 1],
-            [0, 0, 0]
-        ]
-    
-    def get_color(self) -> str:
-        return '#F00000'  # Red
-
-
-class J_Piece(Tetromino):
-    """J-shaped tetromino."""
-    
-    def get_shape(self) -> List[List[int]]:
-        return [
-            [1, 0, 0],
-            [1, 1, 1],
-            [0, 0, 0]
-        ]
-    
-    def get_color(self) -> str:
-        return '#0000F0'  # Blue
-
-
-class L_Piece(Tetromino):
-    """L-shaped tetromino."""
-    
-    def get_shape(self) -> List[List[int]]:
-        return [
-            [0, 0, 1],
-            [1, 1, 1],
-            [0, 0, 0]
-        ]
-    
-    def get_color(self) -> str:
-        return '#F0A000'  # Orange
-
-
-# Type alias for piece classes
-PieceClass = Type[Tetromino]
-
-# All available piece classes
-PIECE_CLASSES: List[PieceClass] = [
-    I_Piece, O_Piece, T_Piece, S_Piece, Z_Piece, J_Piece, L_Piece
-]
+# Remaining pieces of the current 7-bag, dealt from the left
+_bag: Deque[TetrominoType] = deque()
 
 
 def create_random_piece(x: int = 4, y: int = 0) -> Tetromino:
     """
     Create a random tetromino piece.
     
+    Uses the standard 7-bag randomizer: every run of seven pieces contains
+    each piece type exactly once, in shuffled order.
+    
     Args:
         x: Initial x position (default: 4, center of a 10-wide board)
         y: Initial y position (default: 0, top of board)
@@ -240,8 +341,11 @@ def create_random_piece(x: int = 4, y: int = 0) -> Tetromino:
     Returns:
         Random Tetromino instance of one of the seven piece types
     """
-    piece_class: PieceClass = random.choice(PIECE_CLASSES)
-    return piece_class(x, y)
+    if not _bag:
+        order: List[TetrominoType] = list(PIECE_TYPES)
+        random.shuffle(order)
+        _bag.extend(order)
+    return Tetromino(_bag.popleft(), x, y)
 
 
 def create_piece_by_type(piece_type: Union[TetrominoType, str], x: int = 4, y: int = 0) -> Tetromino:
@@ -259,34 +363,23 @@ def create_piece_by_type(piece_type: Union[TetrominoType, str], x: int = 4, y: i
     Raises:
         ValueError: If piece_type is not valid
     """
-    if isinstance(piece_type, str):
-        try:
-            piece_type = TetrominoType(piece_type.upper())
-        except ValueError:
-            raise ValueError(f"Invalid piece type: {piece_type}")
-    
-    piece_map = {
-        TetrominoType.I: I_Piece,
-        TetrominoType.O: O_Piece,
-        TetrominoType.T: T_Piece,
-        TetrominoType.S: S_Piece,
-        TetrominoType.Z: Z_Piece,
-        TetrominoType.J: J_Piece,
-        TetrominoType.L: L_Piece,
-    }
-    
-    piece_class = piece_map.get(piece_type)
-    if not piece_class:
+    if isinstance(piece_type, TetrominoType):
+        return Tetromino(piece_type, x, y)
+    if not isinstance(piece_type, str):
         raise ValueError(f"Unknown piece type: {piece_type}")
     
-    return piece_class(x, y)
+    kind = _TYPE_BY_NAME.get(piece_type.upper())
+    if kind is None:
+        raise ValueError(f"Invalid piece type: {piece_type}")
+    
+    return Tetromino(kind, x, y)
 
 
-def get_all_piece_types() -> List[TetrominoType]:
+def get_all_piece_types() -> Tuple[TetrominoType, ...]:
     """
     Get all available piece types.
     
     Returns:
-        List of all TetrominoType enum values
+        Shared read-only tuple of all TetrominoType enum values
     """
-    return list(TetrominoType)
\ No newline at end of file
+    return PIECE_TYPES
\ No newline at end of file
@@ -10,11 +10,18 @@ class TetrisGame {
         this.blockSize = 30;
         this.boardWidth = 10;
         this.boardHeight = 20;
+        this.fullRowMask = (1 << this.boardWidth) - 1;
         
         // Set canvas size
         this.canvas.width = this.boardWidth * this.blockSize;
         this.canvas.height = this.boardHeight * this.blockSize;
         
+        // Locked blocks are drawn to an offscreen layer where only changed rows are repainted
+        this.boardLayer = document.createElement('canvas');
+        this.boardLayer.width = this.canvas.width;
+        this.boardLayer.height = this.canvas.height;
+        this.boardCtx = this.boardLayer.getContext('2d');
+        
         // Game state
         this.board = [];
         this.currentPiece = null;
@@ -43,6 +50,25 @@ class TetrisGame {
             L: { shape: [[0,0,1], [1,1,1], [0,0,0]], color: '#F0A000' }
         };
         
+        // Board cells hold a piece id (0 = empty); colors are only looked up when drawing
+        this.colors = [null];
+        for (const type of Object.keys(this.pieces)) {
+            const piece = this.pieces[type];
+            piece.id = this.colors.push(piece.color) - 1;
+            
+            // Precompute all four clockwise rotations so rotating is just an index change
+            piece.rotations = [];
+            let shape = piece.shape;
+            for (let i = 0; i < 4; i++) {
+                piece.rotations.push({
+                    shape: shape,
+                    rowMasks: this.getRowMasks(shape),
+                    cells: this.getCells(shape)
+                });
+                shape = this.rotateShape(shape);
+            }
+        }
+        
         // Bind keyboard events
         this.bindEvents();
         
@@ -53,8 +79,28 @@ class TetrisGame {
     
     initBoard() {
         this.board = Array(this.boardHeight).fill().map(() => 
-            Array(this.boardWidth).fill(null)
+            new Uint8Array(this.boardWidth)
         );
+        // Occupancy bitboard: bit k of rowBits[row] is set when column k is filled
+        this.rowBits = new Uint32Array(this.boardHeight);
+        this.dirtyRows = new Set(this.board.keys());
+    }
+    
+    rotateShape(shape) {
+        return shape[0].map((_, i) => shape.map(row => row[i]).reverse());
+    }
+    
+    getCells(shape) {
+        // [col, row] offsets of the filled cells, so callers visit only the four blocks
+        const cells = [];
+        shape.forEach((row, rowIdx) => row.forEach((cell, col) => {
+            if (cell) cells.push([col, rowIdx]);
+        }));
+        return cells;
+    }
+    
+    getRowMasks(shape) {
+        return shape.map(row => row.reduce((mask, cell, col) => cell ? mask | (1 << col) : mask, 0));
     }
     
     bindEvents() {
@@ -86,18 +132,28 @@ class TetrisGame {
         });
     }
     
+    createPiece(type) {
+        const rotation = this.pieces[type].rotations[0];
+        
+        // Shapes and masks are shared with the rotation table and never mutated
+        return {
+            type: type,
+            rotation: 0,
+            shape: rotation.shape,
+            rowMasks: rotation.rowMasks,
+            cells: rotation.cells,
+            id: this.pieces[type].id,
+            color: this.pieces[type].color,
+            x: 0,
+            y: 0
+        };
+    }
+    
     spawnPiece() {
         const pieceTypes = Object.keys(this.pieces);
         
         if (!this.nextPiece) {
-            const nextType = pieceTypes[Math.floor(Math.random() * pieceTypes.length)];
-            this.nextPiece = {
-                type: nextType,
-                shape: JSON.parse(JSON.stringify(this.pieces[nextType].shape)),
-                color: this.pieces[nextType].color,
-                x: 0,
-                y: 0
-            };
+            this.nextPiece = this.createPiece(pieceTypes[Math.floor(Math.random() * pieceTypes.length)]);
         }
         
         this.currentPiece = this.nextPiece;
@@ -105,37 +161,30 @@ class TetrisGame {
         this.currentPiece.y = 0;
         
         // Generate next piece
-        const nextType = pieceTypes[Math.floor(Math.random() * pieceTypes.length)];
-        this.nextPiece = {
-            type: nextType,
-            shape: JSON.parse(JSON.stringify(this.pieces[nextType].shape)),
-            color: this.pieces[nextType].color,
-            x: 0,
-            y: 0
-        };
+        this.nextPiece = this.createPiece(pieceTypes[Math.floor(Math.random() * pieceTypes.length)]);
         
         // Update next piece preview
         this.drawNextPiece();
         
         // Check game over
-        if (!this.isValidPosition(this.currentPiece.shape, this.currentPiece.x, this.currentPiece.y)) {
+        if (!this.isValidPosition(this.currentPiece.rowMasks, this.currentPiece.x, this.currentPiece.y)) {
             this.endGame();
         }
     }
     
-    isValidPosition(shape, x, y) {
-        for (let row = 0; row < shape.length; row++) {
-            for (let col = 0; col < shape[row].length; col++) {
-                if (shape[row][col]) {
-                    const newX = x + col;
-                    const newY = y + row;
-                    
-                    if (newX < 0 || newX >= this.boardWidth || 
-                        newY >= this.boardHeight ||
-                        (newY >= 0 && this.board[newY][newX])) {
-                        return false;
-                    }
-                }
+    isValidPosition(rowMasks, x, y) {
+        for (let row = 0; row < rowMasks.length; row++) {
+            const mask = rowMasks[row];
+            if (!mask) continue;
+            
+            const newY = y + row;
+            const bits = x < 0 ? mask >>> -x : mask << x;
+            
+            // Reject blocks pushed past either wall, below the floor, or onto filled cells
+            if ((x < 0 && (mask & ((1 << -x) - 1))) || (bits & ~this.fullRowMask) ||
+                newY >= this.boardHeight ||
+                (newY >= 0 && (this.rowBits[newY] & bits))) {
+                return false;
             }
         }
         return true;
@@ -147,7 +196,7 @@ class TetrisGame {
         const newX = this.currentPiece.x + dx;
         const newY = this.currentPiece.y + dy;
         
-        if (this.isValidPosition(this.currentPiece.shape, newX, newY)) {
+        if (this.isValidPosition(this.currentPiece.rowMasks, newX, newY)) {
             this.currentPiece.x = newX;
             this.currentPiece.y = newY;
             return true;
@@ -164,21 +213,37 @@ class TetrisGame {
     rotatePiece() {
         if (!this.currentPiece) return;
         
-        const rotated = this.currentPiece.shape[0].map((_, i) =>
-            this.currentPiece.shape.map(row => row[i]).reverse()
-        );
+        const rotation = (this.currentPiece.rotation + 1) & 3;
+        const rotated = this.pieces[this.currentPiece.type].rotations[rotation];
+        
+        if (this.isValidPosition(rotated.rowMasks, this.currentPiece.x, this.currentPiece.y)) {
+            this.currentPiece.rotation = rotation;
+            this.currentPiece.shape = rotated.shape;
+            this.currentPiece.rowMasks = rotated.rowMasks;
+            this.currentPiece.cells = rotated.cells;
+        }
+    }
+    
+    getDropDistance() {
+        const { rowMasks, x, y } = this.currentPiece;
+        let distance = 0;
         
-        if (this.isValidPosition(rotated, this.currentPiece.x, this.currentPiece.y)) {
-            this.currentPiece.shape = rotated;
+        // Probe each row below with isValidPosition instead of moving the piece down a row at a time
+        while (this.isValidPosition(rowMasks, x, y + distance + 1)) {
+            distance++;
         }
+        return distance;
     }
     
     dropPiece() {
         if (!this.currentPiece) return;
         
-        while (this.movePiece(0, 1)) {
-            this.score += 2;
-        }
+        const distance = this.getDropDistance();
+        this.currentPiece.y += distance;
+        this.score += distance * 2;
+        this.lockPiece();
+        // Give the freshly spawned piece a full gravity interval before it falls
+        this.lastDrop = Date.now();
         this.updateScore();
     }
     
@@ -186,15 +251,13 @@ class TetrisGame {
         if (!this.currentPiece) return;
         
         // Add piece to board
-        for (let row = 0; row < this.currentPiece.shape.length; row++) {
-            for (let col = 0; col < this.currentPiece.shape[row].length; col++) {
-                if (this.currentPiece.shape[row][col]) {
-                    const boardY = this.currentPiece.y + row;
-                    const boardX = this.currentPiece.x + col;
-                    if (boardY >= 0) {
-                        this.board[boardY][boardX] = this.currentPiece.color;
-                    }
-                }
+        for (const [col, row] of this.currentPiece.cells) {
+            const boardY = this.currentPiece.y + row;
+            const boardX = this.currentPiece.x + col;
+            if (boardY >= 0) {
+                this.board[boardY][boardX] = this.currentPiece.id;
+                this.rowBits[boardY] |= 1 << boardX;
+                this.dirtyRows.add(boardY);
             }
         }
         
@@ -206,15 +269,31 @@ class TetrisGame {
     }
     
     clearLines() {
-        let linesCleared = 0;
+        const clearedRows = [];
+        let writeRow = this.boardHeight - 1;
         
+        // Compact the remaining rows towards the bottom in a single pass
         for (let row = this.boardHeight - 1; row >= 0; row--) {
-            if (this.board[row].every(cell => cell !== null)) {
-                this.board.splice(row, 1);
-                this.board.unshift(Array(this.boardWidth).fill(null));
-                linesCleared++;
-                row++; // Check the same row again
+            if (this.rowBits[row] === this.fullRowMask) {
+                // Every row from the lowest cleared one upwards moves
+                if (clearedRows.length === 0) {
+                    for (let dirty = 0; dirty <= row; dirty++) {
+                        this.dirtyRows.add(dirty);
+                    }
+                }
+                clearedRows.push(this.board[row]);
+                continue;
             }
+            this.board[writeRow] = this.board[row];
+            this.rowBits[writeRow] = this.rowBits[row];
+            writeRow--;
+        }
+        
+        // Reuse the cleared rows as the new empty rows at the top
+        const linesCleared = clearedRows.length;
+        for (let row = 0; row < linesCleared; row++) {
+            this.board[row] = clearedRows[row].fill(0);
+            this.rowBits[row] = 0;
         }
         
         if (linesCleared > 0) {
@@ -253,31 +332,18 @@ class TetrisGame {
     }
     
     draw() {
-        // Clear canvas
-        this.ctx.fillStyle = '#000';
-        this.ctx.fillRect(0, 0, this.canvas.width, this.canvas.height);
-        
         // Draw board
-        for (let row = 0; row < this.boardHeight; row++) {
-            for (let col = 0; col < this.boardWidth; col++) {
-                if (this.board[row][col]) {
-                    this.drawBlock(col, row, this.board[row][col]);
-                }
-            }
-        }
+        this.drawBoardLayer();
+        this.ctx.drawImage(this.boardLayer, 0, 0);
         
         // Draw current piece
         if (this.currentPiece) {
-            for (let row = 0; row < this.currentPiece.shape.length; row++) {
-                for (let col = 0; col < this.currentPiece.shape[row].length; col++) {
-                    if (this.currentPiece.shape[row][col]) {
-                        this.drawBlock(
-                            this.currentPiece.x + col,
-                            this.currentPiece.y + row,
-                            this.currentPiece.color
-                        );
-                    }
-                }
+            for (const [col, row] of this.currentPiece.cells) {
+                this.drawBlock(
+                    this.currentPiece.x + col,
+                    this.currentPiece.y + row,
+                    this.currentPiece.color
+                );
             }
         }
         
@@ -285,17 +351,31 @@ class TetrisGame {
         this.drawGrid();
     }
     
-    drawBlock(x, y, color) {
+    drawBoardLayer() {
+        for (const row of this.dirtyRows) {
+            this.boardCtx.fillStyle = '#000';
+            this.boardCtx.fillRect(0, row * this.blockSize, this.boardLayer.width, this.blockSize);
+            
+            for (let col = 0; col < this.boardWidth; col++) {
+                if (this.board[row][col]) {
+                    this.drawBlock(col, row, this.colors[this.board[row][col]], this.boardCtx);
+                }
+            }
+        }
+        this.dirtyRows.clear();
+    }
+    
+    drawBlock(x, y, color, ctx = this.ctx) {
         const pixelX = x * this.blockSize;
         const pixelY = y * this.blockSize;
         
-        this.ctx.fillStyle = color;
-        this.ctx.fillRect(pixelX, pixelY, this.blockSize, this.blockSize);
+        ctx.fillStyle = color;
+        ctx.fillRect(pixelX, pixelY, this.blockSize, this.blockSize);
         
         // Draw border
-        this.ctx.strokeStyle = '#333';
-        this.ctx.lineWidth = 1;
-        this.ctx.strokeRect(pixelX, pixelY, this.blockSize, this.blockSize);
+        ctx.strokeStyle = '#333';
+        ctx.lineWidth = 1;
+        ctx.strokeRect(pixelX, pixelY, this.blockSize, this.blockSize);
     }
     
     drawGrid() {
@@ -333,20 +413,16 @@ class TetrisGame {
             const startX = (nextCanvas.width - shape[0].length * nextBlockSize) / 2;
             const startY = (nextCanvas.height - shape.length * nextBlockSize) / 2;
             
-            for (let row = 0; row < shape.length; row++) {
-                for (let col = 0; col < shape[row].length; col++) {
-                    if (shape[row][col]) {
-                        const x = startX + col * nextBlockSize;
-                        const y = startY + row * nextBlockSize;
-                        
-                        nextCtx.fillStyle = this.nextPiece.color;
-                        nextCtx.fillRect(x, y, nextBlockSize, nextBlockSize);
-                        
-                        nextCtx.strokeStyle = '#333';
-                        nextCtx.lineWidth = 1;
-                        nextCtx.strokeRect(x, y, nextBlockSize, nextBlockSize);
-                    }
-                }
+            for (const [col, row] of this.nextPiece.cells) {
+                const x = startX + col * nextBlockSize;
+                const y = startY + row * nextBlockSize;
+                
+                nextCtx.fillStyle = this.nextPiece.color;
+                nextCtx.fillRect(x, y, nextBlockSize, nextBlockSize);
+                
+                nextCtx.strokeStyle = '#333';
+                nextCtx.lineWidth = 1;
+                nextCtx.strokeRect(x, y, nextBlockSize, nextBlockSize);
             }
         }
     }
@@ -3,38 +3,51 @@ Unit tests for the Tetris game application.
 Run with: python -m pytest test_app.py -v
 """
 
+import hashlib
+import os
 import unittest
 import json
-import os
-import tempfile
 from typing import Dict, Any, List, Optional, Union
 from flask.testing import FlaskClient
 from flask import Flask, Response
 
-from app import app, db, Player, Score
+# The engine is created when app is imported, so point it at an in-memory database first
+os.environ['DATABASE_URL'] = 'sqlite:///:memory:'
+
+from app import app, db, Player, Score, invalidate_leaderboard_cache
 
 
 class TetrisTestCase(unittest.TestCase):
     """Test case for Tetris game functionality."""
     
-    def setUp(self) -> None:
-        """Set up test database and client."""
-        self.db_fd, app.config['DATABASE'] = tempfile.mkstemp()
-        app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Configure the app and create the database schema once."""
         app.config['TESTING'] = True
         app.config['WTF_CSRF_ENABLED'] = False
         
-        self.app: FlaskClient = app.test_client()
-        
         with app.app_context():
             db.create_all()
     
-    def tearDown(self) -> None:
-        """Clean up after tests."""
+    @classmethod
+    def tearDownClass(cls) -> None:
+        """Drop the database schema after the last test."""
         with app.app_context():
             db.session.remove()
             db.drop_all()
-        os.close(self.db_fd)
+    
+    def setUp(self) -> None:
+        """Set up test client."""
+        self.app: FlaskClient = app.test_client()
+        invalidate_leaderboard_cache()
+    
+    def tearDown(self) -> None:
+        """Empty every table so the next test starts from a clean database."""
+        with app.app_context():
+            db.session.remove()
+            for table in reversed(db.metadata.sorted_tables):
+                db.session.execute(table.delete())
+            db.session.commit()
     
     def test_index_page(self) -> None:
         """Test that the main game page loads."""
@@ -124,6 +137,24 @@ class TetrisTestCase(unittest.TestCase):
         self.assertFalse(data['success'])
         self.assertIn('Invalid score', data['message'])
     
+    def test_save_score_invalid_level(self) -> None:
+        """Test score saving with a non-integer level."""
+        score_data: Dict[str, Union[str, int]] = {
+            'username': 'TestPlayer',
+            'score': 1000,
+            'lines': 10,
+            'level': '2'
+        }
+        
+        response: Response = self.app.post('/api/score',
+                                         data=json.dumps(score_data),
+                                         content_type='application/json')
+        
+        self.assertEqual(response.status_code, 400)
+        data: Dict[str, Any] = json.loads(response.data)
+        self.assertFalse(data['success'])
+        self.assertIn('Invalid level', data['message'])
+    
     def test_get_top_scores(self) -> None:
         """Test retrieving top scores."""
         # Add some test scores
@@ -149,6 +180,57 @@ class TetrisTestCase(unittest.TestCase):
         self.assertEqual(data[2]['score'], 1500)
         self.assertEqual(data[0]['username'], 'Player1')
     
+    def test_top_scores_conditional_request(self) -> None:
+        """Test that top scores are cacheable and honour If-None-Match."""
+        response: Response = self.app.get('/api/top-scores')
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('max-age=30', response.headers['Cache-Control'])
+        etag: Optional[str] = response.headers.get('ETag')
+        self.assertIsNotNone(etag)
+        
+        cached: Response = self.app.get('/api/top-scores', headers={'If-None-Match': etag})
+        self.assertEqual(cached.status_code, 304)
+        self.assertEqual(cached.data, b'')
+    
+    def test_top_scores_cache_invalidated_on_save(self) -> None:
+        """Test that saving a score refreshes the cached top scores."""
+        response: Response = self.app.get('/api/top-scores')
+        self.assertEqual(json.loads(response.data), [])
+        
+        score_data: Dict[str, Union[str, int]] = {'username': 'CachePlayer', 'score': 700}
+        self.app.post('/api/score', data=json.dumps(score_data), content_type='application/json')
+        
+        response = self.app.get('/api/top-scores')
+        data: List[Dict[str, Any]] = json.loads(response.data)
+        self.assertEqual(len(data), 1)
+        self.assertEqual(data[0]['username'], 'CachePlayer')
+    
+    def test_leaderboard_conditional_request(self) -> None:
+        """Test that the rendered leaderboard is cacheable and honours If-None-Match."""
+        response: Response = self.app.get('/leaderboard')
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('max-age=30', response.headers['Cache-Control'])
+        etag: Optional[str] = response.headers.get('ETag')
+        self.assertEqual(etag, f'"{hashlib.sha1(response.data).hexdigest()}"')
+    
+        cached: Response = self.app.get('/leaderboard', headers={'If-None-Match': etag})
+        self.assertEqual(cached.status_code, 304)
+        self.assertEqual(cached.data, b'')
+    
+    def test_leaderboard_cache_invalidated_on_save(self) -> None:
+        """Test that saving a score refreshes the cached leaderboard page."""
+        response: Response = self.app.get('/leaderboard')
+        self.assertIn(b'No scores yet', response.data)
+        etag: Optional[str] = response.headers.get('ETag')
+    
+        score_data: Dict[str, Union[str, int]] = {'username': 'PagePlayer', 'score': 900}
+        self.app.post('/api/score', data=json.dumps(score_data), content_type='application/json')
+    
+        response = self.app.get('/leaderboard', headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(b'PagePlayer', response.data)
+        self.assertNotIn(b'No scores yet', response.data)
+    
     def test_get_player_stats(self) -> None:
         """Test retrieving player statistics."""
         # Add test data
@@ -269,6 +351,25 @@ class TetrisTestCase(unittest.TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertIn(b'No scores yet', response.data)
     
+    def test_leaderboard_with_scores(self) -> None:
+        """Test that the leaderboard lists saved scores highest first."""
+        for username, score in (('LowScorer', 800), ('HighScorer', 2500)):
+            score_data: Dict[str, Union[str, int]] = {
+                'username': username,
+                'score': score,
+                'lines': 5,
+                'level': 2
+            }
+            self.app.post('/api/score',
+                          data=json.dumps(score_data),
+                          content_type='application/json')
+        
+        response: Response = self.app.get('/leaderboard')
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn(b'No scores yet', response.data)
+        self.assertIn(b'2,500', response.data)
+        self.assertLess(response.data.index(b'HighScorer'), response.data.index(b'LowScorer'))
+    
     def test_duplicate_username_handling(self) -> None:
         """Test handling of duplicate usernames."""
         score_data1: Dict[str, Union[str, int]] = {
@@ -0,0 +1,218 @@
+"""
+Unit tests for the Tetris piece definitions.
+Run with: python -m pytest test_tetromino.py -v
+"""
+
+import unittest
+from typing import Dict, List, Set, Tuple
+
+from models import tetromino
+from models.tetromino import (
+    Tetromino, TetrominoType, create_piece_by_type, create_random_piece, get_all_piece_types
+)
+
+Matrix = List[List[int]]
+
+# Spawn shapes of the original per-piece classes
+REFERENCE_SHAPES: Dict[TetrominoType, Matrix] = {
+    TetrominoType.I: [[0, 0, 0, 0], [1, 1, 1, 1], [0, 0, 0, 0], [0, 0, 0, 0]],
+    TetrominoType.O: [[1, 1], [1, 1]],
+    TetrominoType.T: [[0, 1, 0], [1, 1, 1], [0, 0, 0]],
+    TetrominoType.S: [[0, 1, 1], [1, 1, 0], [0, 0, 0]],
+    TetrominoType.Z: [[1, 1, 0], [0, 1, 1], [0, 0, 0]],
+    TetrominoType.J: [[1, 0, 0], [1, 1, 1], [0, 0, 0]],
+    TetrominoType.L: [[0, 0, 1], [1, 1, 1], [0, 0, 0]],
+}
+
+BOARD_WIDTH = 10
+BOARD_HEIGHT = 20
+
+
+def rotate_matrix(matrix: Matrix, clockwise: bool) -> Matrix:
+    """Rotate a shape matrix 90 degrees the way the original pieces did."""
+    if clockwise:
+        return [list(row) for row in zip(*matrix[::-1])]
+    return [list(row) for row in zip(*matrix)][::-1]
+
+
+def matrix_blocks(matrix: Matrix, x: int, y: int) -> List[Tuple[int, int]]:
+    """List the (x, y) board cells covered by a matrix placed at (x, y)."""
+    return [
+        (x + col_idx, y + row_idx)
+        for row_idx, row in enumerate(matrix)
+        for col_idx, cell in enumerate(row)
+        if cell
+    ]
+
+
+def board_from_cells(cells: Set[Tuple[int, int]]) -> List[int]:
+    """Build a row-bitmask board with the given (x, y) cells filled."""
+    rows = [0] * BOARD_HEIGHT
+    for x, y in cells:
+        rows[y] |= 1 << x
+    return rows
+
+
+def reference_collides(matrix: Matrix, x: int, y: int, cells: Set[Tuple[int, int]]) -> bool:
+    """Cell-by-cell collision test used as the expected result for collides()."""
+    for bx, by in matrix_blocks(matrix, x, y):
+        if bx < 0 or bx >= BOARD_WIDTH or by >= BOARD_HEIGHT:
+            return True
+        if by >= 0 and (bx, by) in cells:
+            return True
+    return False
+
+
+class TetrominoTestCase(unittest.TestCase):
+    """Test case for tetromino shapes, collisions and piece creation."""
+
+    def setUp(self) -> None:
+        """Start every test with a fresh 7-bag."""
+        tetromino._bag.clear()
+
+    def assert_matches_matrix(self, piece: Tetromino, matrix: Matrix) -> None:
+        """Check a piece's blocks and bounding box against a reference matrix."""
+        self.assertEqual(sorted(piece.get_blocks()), sorted(matrix_blocks(matrix, piece.x, piece.y)))
+        self.assertEqual(piece.get_width(), len(matrix[0]))
+        self.assertEqual(piece.get_height(), len(matrix))
+
+    def test_rotations_match_original_shapes(self) -> None:
+        """Test blocks and dimensions for every piece and rotation in both directions."""
+        for kind, spawn in REFERENCE_SHAPES.items():
+            for clockwise in (True, False):
+                with self.subTest(kind=kind, clockwise=clockwise):
+                    piece = Tetromino(kind, 3, 5)
+                    matrix = spawn
+                    self.assert_matches_matrix(piece, matrix)
+
+                    for step in range(1, 5):
+                        piece.rotate(clockwise)
+                        matrix = rotate_matrix(matrix, clockwise)
+                        self.assertEqual(piece.rotation, (step if clockwise else -step) % 4)
+                        self.assert_matches_matrix(piece, matrix)
+
+    def test_copy_is_independent(self) -> None:
+        """Test that rotating or moving a copy leaves the original untouched."""
+        piece = create_piece_by_type('T', 2, 3)
+        clone = piece.copy()
+        clone.rotate()
+        clone.x += 1
+
+        self.assertEqual(piece.rotation, 0)
+        self.assertEqual(piece.x, 2)
+        self.assertEqual(clone.rotation, 1)
+        self.assertEqual(sorted(piece.get_blocks()), sorted(matrix_blocks(REFERENCE_SHAPES[TetrominoType.T], 2, 3)))
+
+    def test_collides_with_walls(self) -> None:
+        """Test collisions against the left and right walls."""
+        piece = Tetromino(TetrominoType.O, 0, 5)
+        self.assertFalse(piece.collides([0] * BOARD_HEIGHT))
+        piece.x = -1
+        self.assertTrue(piece.collides([0] * BOARD_HEIGHT))
+        piece.x = BOARD_WIDTH - 2
+        self.assertFalse(piece.collides([0] * BOARD_HEIGHT))
+        piece.x = BOARD_WIDTH - 1
+        self.assertTrue(piece.collides([0] * BOARD_HEIGHT))
+
+    def test_collides_with_negative_x_and_empty_columns(self) -> None:
+        """Test that empty matrix columns may hang past the left wall but blocks may not."""
+        # Vertical I: only the third matrix column is filled
+        piece = Tetromino(TetrominoType.I, -2, 5)
+        piece.rotate()
+        self.assertFalse(piece.collides([0] * BOARD_HEIGHT))
+        piece.x = -3
+        self.assertTrue(piece.collides([0] * BOARD_HEIGHT))
+
+    def test_collides_with_floor(self) -> None:
+        """Test that blocks may rest on the bottom row but not pass through it."""
+        piece = Tetromino(TetrominoType.T, 4, BOARD_HEIGHT - 2)
+        self.assertFalse(piece.collides([0] * BOARD_HEIGHT))
+        piece.y += 1
+        self.assertTrue(piece.collides([0] * BOARD_HEIGHT))
+
+    def test_rows_above_board_are_open(self) -> None:
+        """Test that blocks above the top row never collide, even over a full top row."""
+        board = [(1 << BOARD_WIDTH) - 1] + [0] * (BOARD_HEIGHT - 1)
+        piece = Tetromino(TetrominoType.I, 3, -2)
+        self.assertFalse(piece.collides(board))
+        piece.y = -1
+        self.assertTrue(piece.collides(board))
+
+    def test_collides_with_filled_cells(self) -> None:
+        """Test collisions against occupied board cells."""
+        board = board_from_cells({(5, 10)})
+        piece = Tetromino(TetrominoType.S, 4, 9)  # covers (5, 9), (6, 9), (4, 10), (5, 10)
+        self.assertTrue(piece.collides(board))
+        piece.x = 6
+        self.assertFalse(piece.collides(board))
+
+    def test_collides_matches_cell_reference(self) -> None:
+        """Test collides() against a cell-by-cell check for every piece, rotation and position."""
+        cells = {(0, 19), (1, 19), (4, 19), (9, 19), (3, 12), (7, 8), (0, 0), (9, 0)}
+        board = board_from_cells(cells)
+
+        for kind, spawn in REFERENCE_SHAPES.items():
+            piece = Tetromino(kind)
+            matrix = spawn
+            for _ in range(4):
+                for x in range(-4, BOARD_WIDTH + 1):
+                    for y in range(-4, BOARD_HEIGHT + 1):
+                        piece.x, piece.y = x, y
+                        expected = reference_collides(matrix, x, y, cells)
+                        if piece.collides(board) != expected:
+                            self.fail(f'{piece!r}: collides() is {not expected}, expected {expected}')
+                piece.rotate()
+                matrix = rotate_matrix(matrix, True)
+
+    def test_random_pieces_deal_from_seven_bag(self) -> None:
+        """Test that every run of seven random pieces contains each type exactly once."""
+        all_types = set(get_all_piece_types())
+        for _ in range(20):
+            bag = [create_random_piece().kind for _ in range(7)]
+            self.assertEqual(set(bag), all_types)
+
+    def test_random_piece_position(self) -> None:
+        """Test the default and explicit spawn positions of random pieces."""
+        piece = create_random_piece()
+        self.assertEqual((piece.x, piece.y, piece.rotation), (4, 0, 0))
+        piece = create_random_piece(2, 3)
+        self.assertEqual((piece.x, piece.y), (2, 3))
+
+    def test_piece_colors(self) -> None:
+        """Test the hex, RGB and packed forms of the piece colors."""
+        piece = create_piece_by_type(TetrominoType.I)
+        self.assertEqual(piece.get_color(), '#00F0F0')
+        self.assertEqual(piece.get_color_rgb(), (0, 0xF0, 0xF0))
+        self.assertEqual(piece.get_color_int(), 0x00F0F0)
+
+        for kind in get_all_piece_types():
+            piece = Tetromino(kind)
+            red, green, blue = piece.get_color_rgb()
+            self.assertEqual(piece.get_color_int(), int(piece.get_color()[1:], 16))
+            self.assertEqual((red << 16) | (green << 8) | blue, piece.get_color_int())
+            self.assertEqual(piece.copy().get_color_int(), piece.get_color_int())
+
+    def test_create_piece_by_type(self) -> None:
+        """Test creating pieces from enum values and case-insensitive names."""
+        for kind in get_all_piece_types():
+            self.assertIs(create_piece_by_type(kind).kind, kind)
+            self.assertIs(create_piece_by_type(kind.value.lower()).kind, kind)
+
+        piece = create_piece_by_type('l', 1, 2)
+        self.assertEqual((piece.x, piece.y), (1, 2))
+        self.assertEqual(piece.get_color(), '#F0A000')
+
+    def test_create_piece_by_type_invalid(self) -> None:
+        """Test that unknown names and non-string values are rejected."""
+        with self.assertRaisesRegex(ValueError, 'Invalid piece type: X'):
+            create_piece_by_type('X')
+        with self.assertRaisesRegex(ValueError, 'Invalid piece type'):
+            create_piece_by_type('')
+        with self.assertRaisesRegex(ValueError, 'Unknown piece type'):
+            create_piece_by_type(3)  # type: ignore[arg-type]
+        with self.assertRaisesRegex(ValueError, 'Unknown piece type'):
+            create_piece_by_type(None)  # type: ignore[arg-type]
+
+
+if __name__ == '__main__':
+    unittest.main()